@@ -18,6 +18,10 @@ Quick start:
 
 Requires: Python 3.9+, requests, pandas
   pip install requests pandas
+Optional: aiohttp (concurrent fetches; falls back to sequential requests),
+  pyarrow (partitioned Parquet storage via --store parquet; faster CSV reads),
+  orjson (faster JSON parsing; falls back to the standard library)
+  pip install aiohttp pyarrow orjson
 
 Notes:
 - Internet is required to fetch data but not for packaging.
@@ -27,8 +31,12 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import csv
 import datetime as dt
+import functools
+import hashlib
 import io
 import json
 import os
@@ -40,12 +48,39 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+except ImportError:  # optional: fetchers fall back to blocking requests
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # optional: needed for --store parquet; CSV reads fall back to pandas
+    pa = None
 
 # -----------------------------
 # Utilities
 # -----------------------------
 
 USER_AGENT = "kaggle-dataset-generator/1.0 (+https://kaggle.com)"
+# Same shape as datetime.isoformat() + "Z": fraction only when microseconds are non-zero
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+ISO_FORMAT_US = "%Y-%m-%dT%H:%M:%S.%fZ"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Max in-flight requests per command when aiohttp is available
+CONCURRENCY = 8
+# Cached responses that may still change (current year, recent windows) expire after this
+CACHE_TTL = 24 * 3600
 
 
 def ensure_dir(p: Path) -> Path:
@@ -53,17 +88,215 @@ def ensure_dir(p: Path) -> Path:
     return p
 
 
+def json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON; `indent` uses two spaces, as json.dumps(indent=2) would."""
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys).encode("utf-8")
+
+
+def iso_utc(values: pd.Series, unit: Optional[str] = None) -> pd.Series:
+    """Render timestamps (epoch numbers in `unit`, or parseable strings) as ISO 8601 UTC strings.
+
+    Conversion and formatting run column-wise; missing values stay missing.
+    """
+    ts = pd.to_datetime(values, unit=unit, utc=True)
+    return ts.dt.strftime(ISO_FORMAT_US).where(ts.dt.microsecond != 0, ts.dt.strftime(ISO_FORMAT))
+
+
 def read_state(path: Path) -> Dict[str, Any]:
     if path.exists():
         try:
-            return json.loads(path.read_text())
+            return json_loads(path.read_bytes())
         except Exception:
             return {}
     return {}
 
 
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file + os.replace so readers never see a partially written file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
 def write_state(path: Path, state: Dict[str, Any]) -> None:
-    path.write_text(json.dumps(state, indent=2, sort_keys=True))
+    write_atomic(path, json_dumps(state, indent=True, sort_keys=True))
+
+
+def cache_load(cache_dir: Optional[Path], key: Optional[str], ttl: Optional[float] = None) -> Optional[bytes]:
+    """Return the cached response body for `key` (a file name), or None if caching is off,
+    missing, or older than `ttl` seconds."""
+    if cache_dir is None or key is None:
+        return None
+    path = cache_dir / key
+    if not path.exists():
+        return None
+    if ttl is not None and time.time() - path.stat().st_mtime > ttl:
+        return None
+    return path.read_bytes()
+
+
+def cache_store(
+    cache_dir: Optional[Path],
+    key: Optional[str],
+    body: bytes,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> None:
+    """Cache a response body; ETag/Last-Modified are kept alongside for conditional refreshes."""
+    if cache_dir is None or key is None:
+        return
+    write_atomic(ensure_dir(cache_dir) / key, body)
+    meta = cache_dir / f"{key}.meta"
+    if etag or last_modified:
+        write_atomic(meta, json_dumps({"etag": etag, "last_modified": last_modified}))
+    elif meta.exists():
+        meta.unlink()
+
+
+def cache_validators(cache_dir: Optional[Path], key: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """(etag, last_modified) stored for a cached body, so an expired entry can be revalidated."""
+    if cache_dir is None or key is None:
+        return None, None
+    meta = cache_dir / f"{key}.meta"
+    if not (cache_dir / key).exists() or not meta.exists():
+        return None, None
+    try:
+        m = json_loads(meta.read_bytes())
+    except ValueError:
+        return None, None
+    return m.get("etag"), m.get("last_modified")
+
+
+def cache_revalidated(cache_dir: Path, key: str) -> bytes:
+    """Mark an expired entry fresh again after a 304 and return its body."""
+    path = cache_dir / key
+    path.touch()
+    return path.read_bytes()
+
+
+def read_csv(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """pd.read_csv(path, usecols=columns) using pyarrow's multithreaded reader when available."""
+    if pa is None:
+        return pd.read_csv(path, usecols=columns)
+    # pyarrow would parse ISO dates/timestamps; keep them as text like pandas does.
+    # The streaming reader only decodes the first block to infer the schema.
+    with pacsv.open_csv(str(path)) as reader:
+        text = {f.name: pa.string() for f in reader.schema if pa.types.is_temporal(f.type)}
+    opts = pacsv.ConvertOptions(column_types=text, include_columns=columns or [], strings_can_be_null=True)
+    return pacsv.read_csv(str(path), convert_options=opts).to_pandas()
+
+
+def write_csv(df: pd.DataFrame, path: Path, append: bool = False) -> None:
+    """df.to_csv(path, index=False); with `append`, rows go to the end without a header."""
+    df.to_csv(path, mode="a" if append else "w", header=not append, index=False)
+
+
+def csv_append_dedup(csv_path: Path, df: pd.DataFrame, keys: List[str]) -> int:
+    """Append rows of `df` whose `keys` are not already in csv_path; returns the total row count.
+
+    Only the key columns of the existing file are read, so the cost scales
+    with the new rows rather than the file's history.
+    """
+    header = pd.read_csv(csv_path, nrows=0).columns
+    seen = read_csv(csv_path, columns=keys).astype(str)
+    new = df.drop_duplicates(subset=keys)
+    is_seen = pd.MultiIndex.from_frame(new[keys].astype(str)).isin(pd.MultiIndex.from_frame(seen))
+    new = new[~is_seen]
+    write_csv(new.reindex(columns=header), csv_path, append=True)
+    return len(seen) + len(new)
+
+
+def csv_rewrite_dedup(csv_path: Path, df: pd.DataFrame, keys: List[str], sort_by: List[str]) -> int:
+    """Merge `df` into csv_path, deduplicate on `keys`, re-sort and rewrite the whole file."""
+    old = read_csv(csv_path)
+    # Concatenating float32 with the float64 history would upcast 4.6 to 4.599999904632568;
+    # widen via the float32 text form so values are written as they were fetched
+    widened = {c: pd.to_numeric(df[c].astype(str)) for c in df.columns if df[c].dtype == "float32"}
+    combined = pd.concat([old, df.assign(**widened)], ignore_index=True)
+    combined.drop_duplicates(subset=keys, inplace=True)
+    # Both inputs are usually already sorted; a stable (run-merging) sort is ~linear on that
+    combined.sort_values(sort_by, inplace=True, kind="stable")
+    write_csv(combined, csv_path)
+    return len(combined)
+
+
+def require_pyarrow() -> None:
+    if pa is None:
+        raise SystemExit("Parquet storage requires pyarrow: pip install pyarrow")
+
+
+def parquet_append(root: Path, df: pd.DataFrame, partition_col: str) -> None:
+    """Write `df` as new Parquet fragments under root/<partition_col>=<value>/.
+
+    Existing fragments are never read or rewritten; duplicates across runs are
+    resolved later by compact_parquet().
+    """
+    require_pyarrow()
+    if df.empty:
+        return
+    stamp = dt.datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+    pq.write_to_dataset(
+        pa.Table.from_pandas(df, preserve_index=False),
+        root_path=str(root),
+        partition_cols=[partition_col],
+        basename_template=f"part-{stamp}-{{i}}.parquet",
+    )
+
+
+def compact_parquet(root: Path, keys: List[str], sort_by: List[str], partition_col: str) -> pd.DataFrame:
+    """Deduplicate a partitioned Parquet dataset in place; returns the compacted frame.
+
+    Fragments are read in write order, so the most recently fetched copy of a
+    key wins.
+    """
+    require_pyarrow()
+    dataset = ds.dataset(str(root), format="parquet", partitioning="hive")
+    # All-null columns are stored as `null` in some fragments; widen to the common type
+    schema = pa.unify_schemas(
+        [dataset.schema] + [f.physical_schema for f in dataset.get_fragments()],
+        promote_options="permissive",
+    )
+    df = ds.dataset(str(root), schema=schema, format="parquet", partitioning="hive").to_table().to_pandas()
+    df[partition_col] = df[partition_col].astype(str)
+    # Arrow list columns come back as numpy arrays; match the lists the fetchers produce
+    for field in schema:
+        if pa.types.is_list(field.type) or pa.types.is_large_list(field.type):
+            df[field.name] = df[field.name].map(lambda v: v.tolist() if v is not None else v)
+    df.drop_duplicates(subset=keys, keep="last", inplace=True)
+    df.sort_values(sort_by, inplace=True, ignore_index=True, kind="stable")
+
+    tmp = root.with_name(root.name + ".compact")
+    if tmp.exists():
+        shutil.rmtree(tmp)
+    parquet_append(tmp, df, partition_col)
+    # Swap by renames; the old copy is only deleted once the compacted one is in place
+    old = root.with_name(root.name + ".old")
+    if old.exists():
+        shutil.rmtree(old)
+    root.rename(old)
+    tmp.rename(root)
+    shutil.rmtree(old)
+    return df
+
+
+class NotModified(Exception):
+    """Raised on HTTP 304: the cached copy the request was conditioned on is still current."""
+
+
+def conditional_headers(etag: Optional[str] = None, last_modified: Optional[str] = None) -> Dict[str, str]:
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
 
 
 class BackoffSession(requests.Session):
@@ -76,47 +309,210 @@ class BackoffSession(requests.Session):
         self.headers.update({"User-Agent": USER_AGENT})
 
     def get_json(self, url: str, **kwargs) -> Any:
+        return json_loads(self.get_content(url, **kwargs))
+
+    def get_content(self, url: str, **kwargs) -> bytes:
+        return self.get_response(url, **kwargs).content
+
+    def get_response(
+        self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None, **kwargs
+    ) -> requests.Response:
+        """GET with backoff. With `etag`/`last_modified` the request is conditional
+        and a 304 raises NotModified."""
+        headers = {**kwargs.pop("headers", {}), **conditional_headers(etag, last_modified)}
         attempt = 0
         while True:
             attempt += 1
-            resp = self.get(url, timeout=60, **kwargs)
-            if resp.status_code == 200:
-                return resp.json()
-            if resp.status_code in {429, 500, 502, 503, 504} and attempt < self.max_retries:
-                # Honor Retry-After when present
-                ra = resp.headers.get("Retry-After")
-                if ra is not None:
-                    try:
-                        delay = float(ra)
-                    except ValueError:
-                        delay = self.backoff ** attempt
-                else:
-                    delay = self.backoff ** attempt
-                time.sleep(delay)
+            resp = self.get(url, timeout=60, headers=headers, **kwargs)
+            if resp.status_code == 304:
+                raise NotModified(url)
+            if 200 <= resp.status_code < 300:
+                # 204 No Content is how FDSN reports an empty result for text formats
+                return resp
+            if resp.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                time.sleep(retry_delay(resp.headers.get("Retry-After"), self.backoff, attempt))
                 continue
             resp.raise_for_status()
 
 
+_SESSION: Optional[BackoffSession] = None
+
+
+def get_session() -> BackoffSession:
+    """Process-wide BackoffSession so connections are pooled and kept alive across fetches."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = BackoffSession()
+        # Retries are handled by get_response, not urllib3
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0))
+        _SESSION.headers.update({"Connection": "keep-alive"})
+    return _SESSION
+
+
+def retry_delay(retry_after: Optional[str], backoff: float, attempt: int) -> float:
+    """Seconds to wait before the next attempt; honors Retry-After when present."""
+    if retry_after is not None:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return backoff ** attempt
+
+
+def async_backoff(max_retries: int = 5, backoff: float = 1.5):
+    """Retry an aiohttp coroutine on 429/5xx with the same policy as BackoffSession."""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    return await fn(*args, **kwargs)
+                except aiohttp.ClientResponseError as e:
+                    if e.status not in RETRY_STATUSES or attempt >= max_retries:
+                        raise
+                    ra = e.headers.get("Retry-After") if e.headers else None
+                    await asyncio.sleep(retry_delay(ra, backoff, attempt))
+
+        return wrapper
+
+    return decorator
+
+
+def async_session() -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=60),
+        headers={"User-Agent": USER_AGENT},
+    )
+
+
+@async_backoff()
+async def _fetch_content(
+    session: aiohttp.ClientSession,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> Tuple[bytes, Optional[str], Optional[str]]:
+    """Returns (body, ETag, Last-Modified); raises NotModified on 304."""
+    async with session.get(url, params=params, headers=conditional_headers(etag, last_modified)) as resp:
+        if resp.status == 304:
+            raise NotModified(url)
+        resp.raise_for_status()
+        return await resp.read(), resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+
+
+def cached_get(
+    url: str,
+    key: Optional[str],
+    cache_dir: Optional[Path],
+    ttl: Optional[float] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    body = cache_load(cache_dir, key, ttl)
+    if body is not None:
+        return body
+    etag, last_modified = cache_validators(cache_dir, key)
+    try:
+        resp = get_session().get_response(url, params=params, etag=etag, last_modified=last_modified)
+    except NotModified:
+        return cache_revalidated(cache_dir, key)
+    cache_store(cache_dir, key, resp.content, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+    return resp.content
+
+
+async def cached_fetch(
+    session: aiohttp.ClientSession,
+    url: str,
+    key: Optional[str],
+    cache_dir: Optional[Path],
+    ttl: Optional[float] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    body = cache_load(cache_dir, key, ttl)
+    if body is not None:
+        return body
+    etag, last_modified = cache_validators(cache_dir, key)
+    try:
+        body, etag, last_modified = await _fetch_content(session, url, params, etag, last_modified)
+    except NotModified:
+        return cache_revalidated(cache_dir, key)
+    cache_store(cache_dir, key, body, etag, last_modified)
+    return body
+
+
+def can_run_async() -> bool:
+    """True when the blocking fetchers may use asyncio.run with aiohttp.
+
+    Inside a running event loop (Jupyter/Kaggle notebooks) asyncio.run fails,
+    so callers there get the blocking path; async code can await the
+    *_async variants directly instead.
+    """
+    if aiohttp is None:
+        return False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return True
+    return False
+
+
+async def gather_bounded(coros: Iterable[Any], limit: int = CONCURRENCY) -> List[Any]:
+    """Await coroutines concurrently with at most `limit` in flight; keeps input order."""
+    sem = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*[run(c) for c in coros])
+
+
 # -----------------------------
 # Connector: USGS Earthquakes
 # -----------------------------
 
 USGS_BASE = "https://earthquake.usgs.gov/fdsnws/event/1/query"
-
-
-def usgs_fetch(
+# Windows that ended longer ago than this are treated as final and cached
+USGS_SETTLE_DAYS = 30
+
+
+def parse_utc(value: str) -> dt.datetime:
+    """Parse an ISO date/time (optionally with `Z` or an offset) as a naive UTC datetime."""
+    if value.endswith("Z"):
+        # fromisoformat only accepts `Z` on Python 3.11+
+        value = value[:-1] + "+00:00"
+    parsed = dt.datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def month_windows(start: str, end: str) -> List[Tuple[str, str]]:
+    """Split [start, end] into consecutive calendar-month windows (naive UTC ISO strings)."""
+    lo = parse_utc(start)
+    hi = parse_utc(end)
+    windows = []
+    while lo < hi:
+        nxt = (lo.replace(day=1) + dt.timedelta(days=32)).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        cut = min(nxt, hi)
+        windows.append((lo.isoformat(), cut.isoformat()))
+        lo = cut
+    return windows or [(start, end)]
+
+
+def usgs_params(
     start: str,
     end: str,
     minmag: Optional[float] = None,
-    bbox: Optional[Tuple[float, float, float, float]] = None,  # minlon, minlat, maxlon, maxlat
+    bbox: Optional[Tuple[float, float, float, float]] = None,
     limit: int = 20000,
-) -> pd.DataFrame:
-    """
-    Fetch earthquakes between start and end (ISO YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS).
-    Returns tidy DataFrame with one row per event.
-    """
+    fmt: str = "geojson",
+) -> Dict[str, Any]:
     params = {
-        "format": "geojson",
+        "format": fmt,
         "starttime": start,
         "endtime": end,
         "limit": limit,
@@ -131,41 +527,210 @@ def usgs_fetch(
             "maxlongitude": bbox[2],
             "maxlatitude": bbox[3],
         })
+    return params
+
+
+USGS_COLUMNS = [
+    "usgs_id", "time", "updated", "mag", "place", "type", "status", "tsunami", "sig",
+    "felt", "cdi", "mmi", "alert", "lon", "lat", "depth_km", "url", "detail", "title",
+]
+# USGS CSV header -> our column names (CSV has no tsunami/sig/felt/cdi/mmi/alert)
+USGS_CSV_RENAME = {"id": "usgs_id", "latitude": "lat", "longitude": "lon", "depth": "depth_km"}
+USGS_EVENT_PAGE = "https://earthquake.usgs.gov/earthquakes/eventpage/"
+
+
+def usgs_geojson_frame(body: bytes) -> pd.DataFrame:
+    """Turn a GeoJSON response into a DataFrame with one row per event."""
+    feats = json_loads(body).get("features", [])
+    if not feats:
+        return pd.DataFrame(columns=USGS_COLUMNS)
+    raw = pd.json_normalize(feats)
+    coords = raw["geometry.coordinates"] if "geometry.coordinates" in raw else pd.Series([None] * len(raw))
+    xyz = pd.DataFrame(
+        [c if isinstance(c, list) else [None, None, None] for c in coords],
+        columns=["lon", "lat", "depth_km"],
+        index=raw.index,
+    )
+    props = {c: c[len("properties."):] for c in raw.columns if c.startswith("properties.")}
+    df = pd.concat([raw[list(props)].rename(columns=props), xyz], axis=1)
+    df["usgs_id"] = raw["id"]
+    for col in ("time", "updated"):
+        if col in df:
+            df[col] = iso_utc(df[col], unit="ms")
+    return df.reindex(columns=USGS_COLUMNS)
 
-    s = BackoffSession()
-    js = s.get_json(USGS_BASE, params=params)
-
-    feats = js.get("features", [])
-    rows = []
-    for f in feats:
-        prop = f.get("properties", {})
-        geom = f.get("geometry", {}) or {}
-        coords = geom.get("coordinates", [None, None, None])
-        rows.append({
-            "usgs_id": f.get("id"),
-            "time": dt.datetime.utcfromtimestamp((prop.get("time") or 0) / 1000.0).isoformat() + "Z" if prop.get("time") else None,
-            "updated": dt.datetime.utcfromtimestamp((prop.get("updated") or 0) / 1000.0).isoformat() + "Z" if prop.get("updated") else None,
-            "mag": prop.get("mag"),
-            "place": prop.get("place"),
-            "type": prop.get("type"),
-            "status": prop.get("status"),
-            "tsunami": prop.get("tsunami"),
-            "sig": prop.get("sig"),
-            "felt": prop.get("felt"),
-            "cdi": prop.get("cdi"),
-            "mmi": prop.get("mmi"),
-            "alert": prop.get("alert"),
-            "lon": coords[0],
-            "lat": coords[1],
-            "depth_km": coords[2],
-            "url": prop.get("url"),
-            "detail": prop.get("detail"),
-            "title": prop.get("title"),
-        })
-    df = pd.DataFrame(rows)
-    if not df.empty:
-        df.sort_values("time", inplace=True, ignore_index=True)
-    return df
+
+def usgs_csv_frame(body: bytes) -> pd.DataFrame:
+    """Turn a format=csv response into the same columns as usgs_geojson_frame.
+
+    url, detail and title are rebuilt from the event id, magnitude and place;
+    the GeoJSON-only fields are left empty.
+    """
+    if not body.strip():
+        return pd.DataFrame(columns=USGS_COLUMNS)
+    df = pd.read_csv(io.BytesIO(body)).rename(columns=USGS_CSV_RENAME)
+    if df.empty:
+        return pd.DataFrame(columns=USGS_COLUMNS)
+    for col in ("time", "updated"):
+        df[col] = iso_utc(df[col])
+    df["url"] = USGS_EVENT_PAGE + df["usgs_id"]
+    df["detail"] = USGS_BASE + "?eventid=" + df["usgs_id"] + "&format=geojson"
+    df["title"] = ("M " + df["mag"].round(1).astype(str) + " - " + df["place"].astype(str)).where(df["place"].notna())
+    return df.reindex(columns=USGS_COLUMNS)
+
+
+USGS_PARSERS = {"geojson": usgs_geojson_frame, "csv": usgs_csv_frame}
+# Compact dtypes: categories for low-cardinality text, 32-bit floats, nullable small ints
+USGS_DTYPES = {
+    "type": "category",
+    "status": "category",
+    "alert": "category",
+    "tsunami": "Int8",
+    "mag": "float32",
+    "sig": "Int32",
+    "felt": "Int32",
+    "cdi": "float32",
+    "mmi": "float32",
+    "depth_km": "float32",
+    "lat": "float32",
+    "lon": "float32",
+}
+
+
+def usgs_combine(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate per-window frames into one table sorted by time."""
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=USGS_COLUMNS)
+    # Month windows share their boundary instant
+    df.drop_duplicates(subset=["usgs_id"], inplace=True)
+    df.sort_values("time", inplace=True, ignore_index=True)
+    return df.astype(USGS_DTYPES)
+
+
+def usgs_cache_key(params: Dict[str, Any], cache_dir: Optional[Path]) -> Optional[str]:
+    """Cache file name for a USGS window, or None when caching is off or the window
+    is recent enough to be revised."""
+    if cache_dir is None:
+        return None
+    end = parse_utc(params["endtime"])
+    if dt.datetime.utcnow() - end < dt.timedelta(days=USGS_SETTLE_DAYS):
+        return None
+    blob = USGS_BASE + json.dumps(params, sort_keys=True)
+    ext = "csv" if params["format"] == "csv" else "json"
+    return f"{hashlib.sha1(blob.encode('utf-8')).hexdigest()}.{ext}"
+
+
+def usgs_split_key(key: Optional[str]) -> Optional[str]:
+    """Cache entry marking a settled window that hit `limit`; its halves are cached instead."""
+    return None if key is None else f"{key}.split"
+
+
+def split_window(params: Dict[str, Any], n_rows: int) -> Optional[List[Dict[str, Any]]]:
+    """Halve a window whose response hit `limit` (events were truncated); None if it is complete."""
+    if n_rows < params["limit"]:
+        return None
+    lo = parse_utc(params["starttime"])
+    hi = parse_utc(params["endtime"])
+    mid = (lo + (hi - lo) / 2).replace(microsecond=0)
+    if mid <= lo:
+        print(f"Warning: {params['starttime']} → {params['endtime']} still has >= {params['limit']} events; results truncated.", file=sys.stderr)
+        return None
+    return [
+        {**params, "starttime": lo.isoformat(), "endtime": mid.isoformat()},
+        {**params, "starttime": mid.isoformat(), "endtime": hi.isoformat()},
+    ]
+
+
+async def _fetch_window(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    params: Dict[str, Any],
+    cache_dir: Optional[Path] = None,
+) -> pd.DataFrame:
+    key = usgs_cache_key(params, cache_dir)
+    if cache_load(cache_dir, usgs_split_key(key)) is not None:
+        halves = split_window(params, params["limit"])
+    else:
+        body = cache_load(cache_dir, key)
+        fetched = body is None
+        if fetched:
+            async with sem:
+                body, _, _ = await _fetch_content(session, USGS_BASE, params)
+        df = USGS_PARSERS[params["format"]](body)
+        halves = split_window(params, len(df))
+        # Only complete bodies are cached; a truncated one just records that the window splits
+        if halves is None:
+            if fetched:
+                cache_store(cache_dir, key, body)
+            return df
+        cache_store(cache_dir, usgs_split_key(key), b"")
+    # Truncated: both halves are fetched concurrently and may split again
+    parts = await asyncio.gather(*[_fetch_window(session, sem, p, cache_dir) for p in halves])
+    return pd.concat(parts, ignore_index=True)
+
+
+def fetch_window(params: Dict[str, Any], cache_dir: Optional[Path] = None) -> pd.DataFrame:
+    """Blocking counterpart of _fetch_window."""
+    key = usgs_cache_key(params, cache_dir)
+    if cache_load(cache_dir, usgs_split_key(key)) is not None:
+        halves = split_window(params, params["limit"])
+    else:
+        body = cache_load(cache_dir, key)
+        fetched = body is None
+        if fetched:
+            body = get_session().get_response(USGS_BASE, params=params).content
+        df = USGS_PARSERS[params["format"]](body)
+        halves = split_window(params, len(df))
+        if halves is None:
+            if fetched:
+                cache_store(cache_dir, key, body)
+            return df
+        cache_store(cache_dir, usgs_split_key(key), b"")
+    return pd.concat([fetch_window(p, cache_dir) for p in halves], ignore_index=True)
+
+
+async def usgs_fetch_async(
+    start: str,
+    end: str,
+    minmag: Optional[float] = None,
+    bbox: Optional[Tuple[float, float, float, float]] = None,
+    limit: int = 20000,
+    cache_dir: Optional[Path] = None,
+    fmt: str = "geojson",
+) -> pd.DataFrame:
+    """Async variant of usgs_fetch: one request per calendar month, run concurrently."""
+    # One semaphore across all windows, including any split halves
+    sem = asyncio.Semaphore(CONCURRENCY)
+    async with async_session() as session:
+        frames = await asyncio.gather(*[
+            _fetch_window(session, sem, usgs_params(s, e, minmag, bbox, limit, fmt), cache_dir)
+            for s, e in month_windows(start, end)
+        ])
+    return usgs_combine(frames)
+
+
+def usgs_fetch(
+    start: str,
+    end: str,
+    minmag: Optional[float] = None,
+    bbox: Optional[Tuple[float, float, float, float]] = None,  # minlon, minlat, maxlon, maxlat
+    limit: int = 20000,
+    cache_dir: Optional[Path] = None,
+    fmt: str = "geojson",
+) -> pd.DataFrame:
+    """
+    Fetch earthquakes between start and end (ISO YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS).
+    With aiohttp the window is split per calendar month and fetched concurrently;
+    otherwise it is one request. Any window returning `limit` events is halved
+    until every request comes back complete.
+    Windows older than USGS_SETTLE_DAYS are served from `cache_dir` when given.
+    `fmt="csv"` requests the smaller CSV feed, which lacks tsunami/sig/felt/cdi/mmi/alert.
+    Returns tidy DataFrame with one row per event.
+    """
+    if can_run_async():
+        return asyncio.run(usgs_fetch_async(start, end, minmag=minmag, bbox=bbox, limit=limit, cache_dir=cache_dir, fmt=fmt))
+
+    # Sequential month requests would only add round trips; split_window handles truncation
+    return usgs_combine([fetch_window(usgs_params(start, end, minmag, bbox, limit, fmt), cache_dir)])
 
 
 def earthquakes_command(args: argparse.Namespace) -> None:
@@ -186,18 +751,35 @@ def earthquakes_command(args: argparse.Namespace) -> None:
             raise SystemExit("--bbox must be 'minlon,minlat,maxlon,maxlat'")
         bbox = (parts[0], parts[1], parts[2], parts[3])
 
-    df = usgs_fetch(start=start, end=end, minmag=args.minmag, bbox=bbox)
-    csv_path = out_dir / "earthquakes.csv"
-
-    if csv_path.exists() and not args.overwrite:
-        # Append & deduplicate on usgs_id
-        old = pd.read_csv(csv_path)
-        combined = pd.concat([old, df], ignore_index=True)
-        combined.drop_duplicates(subset=["usgs_id"], inplace=True)
-        combined.sort_values("time", inplace=True)
-        combined.to_csv(csv_path, index=False)
+    cache_dir = None if args.no_cache else Path(args.cache_dir) / "usgs"
+    df = usgs_fetch(start=start, end=end, minmag=args.minmag, bbox=bbox, cache_dir=cache_dir, fmt=args.source_format)
+
+    if df.empty and not args.overwrite:
+        # Nothing to merge: skip reading/rewriting existing output, just advance the window
+        state.update({"last_end": end, "last_run": dt.datetime.utcnow().isoformat() + "Z"})
+        write_state(state_path, state)
+        print(f"No new events between {start} and {end}.")
+        return
+
+    if args.store == "parquet":
+        # Only the new fragment is written; `compact` deduplicates later
+        root = out_dir / "earthquakes"
+        if args.overwrite and root.exists():
+            shutil.rmtree(root)
+        parquet_append(root, df.assign(date=df["time"].str[:10]), partition_col="date")
+        summary = f"Wrote {len(df)} rows to {root} (run `compact` to deduplicate)."
     else:
-        df.to_csv(csv_path, index=False)
+        csv_path = out_dir / "earthquakes.csv"
+        if csv_path.exists() and not args.overwrite:
+            # Append & deduplicate on usgs_id
+            if args.sort:
+                n_rows = csv_rewrite_dedup(csv_path, df, keys=["usgs_id"], sort_by=["time"])
+            else:
+                n_rows = csv_append_dedup(csv_path, df, keys=["usgs_id"])
+        else:
+            write_csv(df, csv_path)
+            n_rows = len(df)
+        summary = f"Wrote {csv_path} with {n_rows} rows (excluding header)."
 
     # Minimal data card update
     dc_path = out_dir / "data_card.md"
@@ -210,7 +792,7 @@ def earthquakes_command(args: argparse.Namespace) -> None:
 
     state.update({"last_end": end, "last_run": dt.datetime.utcnow().isoformat() + "Z"})
     write_state(state_path, state)
-    print(f"Wrote {csv_path} with {sum(1 for _ in open(csv_path, 'rb')) - 1} rows (excluding header).")
+    print(summary)
 
 
 # -----------------------------
@@ -218,6 +800,12 @@ def earthquakes_command(args: argparse.Namespace) -> None:
 # -----------------------------
 
 NAGER_BASE = "https://date.nager.at/api/v3/PublicHolidays/{year}/{country}"
+NAGER_RENAME = {
+    "localName": "local_name",
+    "englishName": "english_name",
+    "global": "is_global",
+    "fixed": "is_fixed",
+}
 
 
 def parse_years_span(span: str) -> List[int]:
@@ -229,62 +817,145 @@ def parse_years_span(span: str) -> List[int]:
     return [int(span)]
 
 
-def holidays_fetch(country: str, years: Iterable[int]) -> pd.DataFrame:
-    s = BackoffSession()
-    frames = []
-    for y in years:
-        url = NAGER_BASE.format(year=y, country=country)
-        js = s.get_json(url)
-        # normalize
-        df = pd.DataFrame(js)
-        if df.empty:
-            continue
-        # Flatten 'counties' list into pipe-separated string
-        if "counties" in df.columns:
-            df["counties"] = df["counties"].apply(lambda x: "|".join(x) if isinstance(x, list) else None)
-        df["year"] = y
-        frames.append(df)
-    if frames:
-        out = pd.concat(frames, ignore_index=True)
-        # Rename a few columns to snake_case
-        rename = {
-            "localName": "local_name",
-            "englishName": "english_name",
-            "global": "is_global",
-            "fixed": "is_fixed",
-        }
-        for k, v in rename.items():
-            if k in out.columns:
-                out.rename(columns={k: v}, inplace=True)
-        return out
-    return pd.DataFrame()
+def holidays_frame(pages: Iterable[Tuple[int, Any]]) -> pd.DataFrame:
+    """Build the holidays table from (year, Nager.Date JSON) pairs."""
+    # Collect plain records and build the frame once, rather than a frame per year
+    records = []
+    for y, js in pages:
+        for row in js or []:
+            row["year"] = y
+            records.append(row)
+    if not records:
+        return pd.DataFrame()
+    out = pd.DataFrame.from_records(records)
+    # Flatten 'counties' list into pipe-separated string
+    if "counties" in out.columns:
+        out["counties"] = out["counties"].str.join("|")
+    # Rename a few columns to snake_case (missing ones are ignored)
+    out.rename(columns=NAGER_RENAME, errors="ignore", inplace=True)
+    return out
+
+
+def nager_cache_ttl(year: int) -> Optional[float]:
+    """Past years are final; the current and future years may still be amended."""
+    return None if year < dt.datetime.utcnow().year else CACHE_TTL
+
+
+async def holidays_fetch_async(country: str, years: Iterable[int], cache_dir: Optional[Path] = None) -> pd.DataFrame:
+    """Async variant of holidays_fetch: all years requested concurrently."""
+    years = list(years)
+    async with async_session() as session:
+        pages = await gather_bounded(
+            cached_fetch(
+                session,
+                NAGER_BASE.format(year=y, country=country),
+                f"nager_{country}_{y}.json",
+                cache_dir,
+                ttl=nager_cache_ttl(y),
+            )
+            for y in years
+        )
+    return holidays_frame((y, json_loads(body)) for y, body in zip(years, pages))
+
+
+def holidays_fetch(country: str, years: Iterable[int], cache_dir: Optional[Path] = None) -> pd.DataFrame:
+    """Fetch holidays for `country` over `years`; responses are memoized in `cache_dir` when given."""
+    if can_run_async():
+        return asyncio.run(holidays_fetch_async(country, years, cache_dir=cache_dir))
+
+    return holidays_frame(
+        (y, json_loads(cached_get(NAGER_BASE.format(year=y, country=country), f"nager_{country}_{y}.json", cache_dir, ttl=nager_cache_ttl(y))))
+        for y in years
+    )
+
+
+def holidays_country(job: Tuple[str, List[int], argparse.Namespace]) -> Tuple[str, int, str]:
+    """Fetch and store one country; returns (country, records fetched, summary line).
+
+    Module-level so it can run in a ProcessPoolExecutor worker.
+    """
+    country, years, args = job
+    out_dir = Path(args.out)
+    cache_dir = None if args.no_cache else Path(args.cache_dir) / "nager"
+    df = holidays_fetch(country, years, cache_dir=cache_dir)
+    if df.empty and not args.overwrite:
+        return country, 0, f"No holidays returned for {country}; existing output left untouched."
+
+    if args.store == "parquet":
+        root = out_dir / f"public_holidays_{country}"
+        if args.overwrite and root.exists():
+            shutil.rmtree(root)
+        parquet_append(root, df, partition_col="year")
+        summary = f"Wrote {len(df)} rows to {root} (run `compact` to deduplicate)."
+    else:
+        csv_path = out_dir / f"public_holidays_{country}.csv"
+        if csv_path.exists() and not args.overwrite:
+            keys = ["date", "countryCode"]
+            if args.sort:
+                n_rows = csv_rewrite_dedup(csv_path, df, keys=keys, sort_by=keys)
+            else:
+                n_rows = csv_append_dedup(csv_path, df, keys=keys)
+        else:
+            write_csv(df, csv_path)
+            n_rows = len(df)
+        summary = f"Wrote {csv_path} with {n_rows} rows (excluding header)."
+    return country, len(df), summary
 
 
 def holidays_command(args: argparse.Namespace) -> None:
     out_dir = ensure_dir(Path(args.out))
     years = parse_years_span(args.years) if args.years else [dt.datetime.utcnow().year]
-    df = holidays_fetch(args.country, years)
-
-    csv_path = out_dir / f"public_holidays_{args.country.upper()}.csv"
-    if csv_path.exists() and not args.overwrite:
-        old = pd.read_csv(csv_path)
-        combined = pd.concat([old, df], ignore_index=True)
-        combined.drop_duplicates(subset=["date", "countryCode"], inplace=True)
-        combined.sort_values(["date", "countryCode"], inplace=True)
-        combined.to_csv(csv_path, index=False)
+    countries = list(dict.fromkeys(c.strip().upper() for c in args.country.split(",") if c.strip()))
+    jobs = [(c, years, args) for c in countries]
+
+    if args.jobs > 1 and len(jobs) > 1:
+        # Countries are independent (one output file each), so they run in separate processes
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(jobs))) as ex:
+            results = list(ex.map(holidays_country, jobs))
     else:
-        df.to_csv(csv_path, index=False)
+        results = [holidays_country(job) for job in jobs]
 
+    # Data card is shared by all countries, so it is only written from this process
     dc_path = out_dir / "data_card.md"
-    append_data_card(dc_path, section_title=f"Public Holidays — {args.country.upper()}", content=f"""
+    for country, n_added, summary in results:
+        print(summary)
+        if not n_added:
+            continue
+        append_data_card(dc_path, section_title=f"Public Holidays — {country}", content=f"""
 **Source:** Nager.Date Public Holidays API\
 **Years:** {min(years)}–{max(years)}\
-**Country:** {args.country.upper()}\
-**Records added:** {len(df)}\
+**Country:** {country}\
+**Records added:** {n_added}\
 **Fields (subset):** date, local_name, english_name, countryCode, fixed, is_global, types, counties.
 """)
 
-    print(f"Wrote {csv_path} with {sum(1 for _ in open(csv_path, 'rb')) - 1} rows (excluding header).")
+
+# -----------------------------
+# Parquet compaction
+# -----------------------------
+
+def compact_command(args: argparse.Namespace) -> None:
+    out_dir = Path(args.out)
+    if args.dataset == "earthquakes":
+        name, keys, sort_by, part = "earthquakes", ["usgs_id"], ["time"], "date"
+    else:
+        if not args.country:
+            raise SystemExit("--country is required for --dataset holidays")
+        name, keys, sort_by, part = f"public_holidays_{args.country.upper()}", ["date", "countryCode"], ["date", "countryCode"], "year"
+
+    root = out_dir / name
+    if not root.exists():
+        raise SystemExit(f"Parquet dataset not found: {root}")
+    df = compact_parquet(root, keys=keys, sort_by=sort_by, partition_col=part)
+    print(f"Compacted {root} to {len(df)} rows.")
+
+    if args.emit_csv:
+        csv_path = out_dir / f"{name}.csv"
+        if part == "date":
+            # Partition column is derived from `time`, not part of the schema
+            df = df.drop(columns=[part])
+        write_csv(df, csv_path)
+        print(f"Wrote {csv_path} with {len(df)} rows (excluding header).")
 
 
 # -----------------------------
@@ -326,12 +997,14 @@ def build_kaggle_package(
         "id": f"{owner}/{slug}",
         "licenses": [{"name": license_name}],
     }
-    (pkg / "dataset-metadata.json").write_text(json.dumps(meta, indent=2))
+    (pkg / "dataset-metadata.json").write_bytes(json_dumps(meta, indent=True))
 
-    # Copy files next to metadata
-    for src in files:
-        dst = pkg / Path(src).name
-        shutil.copy2(src, dst)
+    # Copy files next to metadata; copies overlap on disk I/O (copy2 uses sendfile on Linux).
+    # One source per destination name (the last one wins) so no two threads write the same file.
+    targets = {Path(src).name: src for src in files}
+    if targets:
+        with ThreadPoolExecutor(max_workers=min(8, len(targets))) as ex:
+            list(ex.map(lambda item: shutil.copy2(item[1], pkg / item[0]), targets.items()))
 
     # If a description file is provided, ensure it's named README.md per Kaggle UX
     if description_md and Path(description_md).exists():
@@ -375,15 +1048,32 @@ def build_parser() -> argparse.ArgumentParser:
     p_eq.add_argument("--bbox", type=str, default=None, help="minlon,minlat,maxlon,maxlat")
     p_eq.add_argument("--out", type=str, default="./data", help="Output folder")
     p_eq.add_argument("--overwrite", action="store_true", help="Overwrite existing CSV instead of append+dedup")
+    p_eq.add_argument("--sort", action="store_true", help="Rewrite the whole CSV deduplicated and sorted instead of appending new rows")
+    p_eq.add_argument("--store", choices=["csv", "parquet"], default="csv", help="Output format (parquet: date-partitioned, dedup via `compact`)")
+    p_eq.add_argument("--source-format", choices=["geojson", "csv"], default="geojson", help="USGS response format (csv: ~3x smaller, but no tsunami/sig/felt/cdi/mmi/alert)")
+    p_eq.add_argument("--cache-dir", type=str, default="./.cache", help="Folder for cached API responses")
+    p_eq.add_argument("--no-cache", action="store_true", help="Always re-fetch instead of using cached responses")
     p_eq.set_defaults(func=earthquakes_command)
 
     p_h = sub.add_parser("holidays", help="Fetch public holidays by country (Nager.Date)")
-    p_h.add_argument("--country", type=str, required=True, help="ISO 3166-1 alpha-2 (e.g., FR, US, DE)")
+    p_h.add_argument("--country", type=str, required=True, help="ISO 3166-1 alpha-2, or a comma-separated list (e.g., FR or US,FR,DE)")
+    p_h.add_argument("--jobs", type=int, default=1, help="Worker processes when fetching several countries")
     p_h.add_argument("--years", type=str, default=None, help="Year or span like 2015:2025")
     p_h.add_argument("--out", type=str, default="./data", help="Output folder")
     p_h.add_argument("--overwrite", action="store_true", help="Overwrite existing CSV instead of append+dedup")
+    p_h.add_argument("--sort", action="store_true", help="Rewrite the whole CSV deduplicated and sorted instead of appending new rows")
+    p_h.add_argument("--store", choices=["csv", "parquet"], default="csv", help="Output format (parquet: year-partitioned, dedup via `compact`)")
+    p_h.add_argument("--cache-dir", type=str, default="./.cache", help="Folder for cached API responses")
+    p_h.add_argument("--no-cache", action="store_true", help="Always re-fetch instead of using cached responses")
     p_h.set_defaults(func=holidays_command)
 
+    p_c = sub.add_parser("compact", help="Deduplicate a Parquet dataset written with --store parquet")
+    p_c.add_argument("--dataset", choices=["earthquakes", "holidays"], required=True, help="Which dataset to compact")
+    p_c.add_argument("--country", type=str, default=None, help="Country code (holidays only)")
+    p_c.add_argument("--out", type=str, default="./data", help="Output folder used when fetching")
+    p_c.add_argument("--emit-csv", action="store_true", help="Also export the compacted table as CSV (e.g., before Kaggle upload)")
+    p_c.set_defaults(func=compact_command)
+
     p_pkg = sub.add_parser("package", help="Assemble a Kaggle dataset folder")
     p_pkg.add_argument("--title", type=str, required=True, help="Dataset title")
     p_pkg.add_argument("--owner", type=str, required=True, help="Your Kaggle username (owner slug)")